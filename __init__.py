@@ -6,56 +6,42 @@ This package provides shadow nodes that augment FLUX2-JSON inputs
 with deterministic, profile-based procedural text generation.
 """
 
-# Import all node modules
-from .nodes.subject_nodes import (
-    NODE_CLASS_MAPPINGS as SUBJECT_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as SUBJECT_DISPLAY_MAPPINGS,
-)
-from .nodes.scene_nodes import (
-    NODE_CLASS_MAPPINGS as SCENE_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as SCENE_DISPLAY_MAPPINGS,
-)
-from .nodes.style_nodes import (
-    NODE_CLASS_MAPPINGS as STYLE_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as STYLE_DISPLAY_MAPPINGS,
-)
-from .nodes.lighting_nodes import (
-    NODE_CLASS_MAPPINGS as LIGHTING_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as LIGHTING_DISPLAY_MAPPINGS,
-)
-from .nodes.camera_nodes import (
-    NODE_CLASS_MAPPINGS as CAMERA_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as CAMERA_DISPLAY_MAPPINGS,
-)
-from .nodes.composition_nodes import (
-    NODE_CLASS_MAPPINGS as COMPOSITION_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as COMPOSITION_DISPLAY_MAPPINGS,
-)
-from .nodes.utility_nodes import (
-    NODE_CLASS_MAPPINGS as UTILITY_MAPPINGS,
-    NODE_DISPLAY_NAME_MAPPINGS as UTILITY_DISPLAY_MAPPINGS,
+import importlib
+
+# Node modules, in registration order
+_NODE_MODULES = (
+    "subject_nodes",
+    "scene_nodes",
+    "style_nodes",
+    "lighting_nodes",
+    "camera_nodes",
+    "composition_nodes",
+    "utility_nodes",
 )
 
-# Merge all mappings
-NODE_CLASS_MAPPINGS = {
-    **SUBJECT_MAPPINGS,
-    **SCENE_MAPPINGS,
-    **STYLE_MAPPINGS,
-    **LIGHTING_MAPPINGS,
-    **CAMERA_MAPPINGS,
-    **COMPOSITION_MAPPINGS,
-    **UTILITY_MAPPINGS,
-}
 
-NODE_DISPLAY_NAME_MAPPINGS = {
-    **SUBJECT_DISPLAY_MAPPINGS,
-    **SCENE_DISPLAY_MAPPINGS,
-    **STYLE_DISPLAY_MAPPINGS,
-    **LIGHTING_DISPLAY_MAPPINGS,
-    **CAMERA_DISPLAY_MAPPINGS,
-    **COMPOSITION_DISPLAY_MAPPINGS,
-    **UTILITY_DISPLAY_MAPPINGS,
-}
+def _load_node_modules() -> None:
+    """Import every node module and publish the merged mappings."""
+    class_mappings = {}
+    display_name_mappings = {}
+    for module_name in _NODE_MODULES:
+        module = importlib.import_module(f".nodes.{module_name}", __name__)
+        class_mappings.update(module.NODE_CLASS_MAPPINGS)
+        display_name_mappings.update(module.NODE_DISPLAY_NAME_MAPPINGS)
+
+    globals().update(
+        NODE_CLASS_MAPPINGS=class_mappings,
+        NODE_DISPLAY_NAME_MAPPINGS=display_name_mappings,
+    )
+
+
+def __getattr__(name):
+    """Lazily assemble the node mappings on first access (PEP 562)."""
+    if name in ("NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS"):
+        _load_node_modules()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Package metadata
 __version__ = "1.0.0"
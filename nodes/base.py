@@ -3,17 +3,44 @@ Zero2JSON Base Classes
 Position-as-seed procedural text generation for FLUX2-JSON integration
 """
 
+import _string
 import json
+import mmap
+import os
+import string
 import struct
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 import xxhash
 
+try:
+    import orjson
+except ImportError:  # Optional: faster profile parsing
+    orjson = None
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
 PROFILES_DIR = Path(__file__).parent.parent / "profiles"
+PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+
+# discover_profiles reuses its last result without touching the filesystem
+# for this many seconds, since ComfyUI calls INPUT_TYPES in bursts
+_DISCOVER_TTL = 2.0
+_DISCOVER_RECENT: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
+# Profiles at least this large are memory-mapped rather than read into bytes
+_MMAP_MIN_BYTES = 1 << 20
+
+# Precompiled little-endian int32 packers, keyed by coordinate count
+_PACK_COORD2 = struct.Struct('<ii').pack
+_COORD_PACKERS: Dict[int, Any] = {2: _PACK_COORD2}
+
+_FORMATTER = string.Formatter()
 
 # ============================================================================
 # CORE HASH FUNCTIONS (Position-as-Seed Methodology)
@@ -30,9 +57,16 @@ def prompt_hash(seed: int, *coords: int) -> int:
 
     Returns: Deterministic 32-bit integer
     """
-    h = xxhash.xxh32(seed=seed & 0xFFFFFFFF)
-    h.update(struct.pack('<' + 'i' * len(coords), *coords))
-    return h.intdigest()
+    pack = _COORD_PACKERS.get(len(coords))
+    if pack is None:
+        pack = _COORD_PACKERS[len(coords)] = struct.Struct('<' + 'i' * len(coords)).pack
+    return xxhash.xxh32_intdigest(pack(*coords), seed & 0xFFFFFFFF)
+
+
+@lru_cache(maxsize=128)
+def profile_name_hash(name: str) -> int:
+    """32-bit hash of a profile name (or separator) for IS_CHANGED keys, memoized."""
+    return xxhash.xxh3_64_intdigest(name.encode()) & 0xFFFFFFFF
 
 
 def hash_to_index(h: int, pool_size: int) -> int:
@@ -45,40 +79,57 @@ def hash_to_index(h: int, pool_size: int) -> int:
 # ============================================================================
 
 def get_profiles_dir() -> Path:
-    """Get the profiles directory path, creating if needed."""
-    if not PROFILES_DIR.exists():
-        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    """Get the profiles directory path (created at import time)."""
     return PROFILES_DIR
 
 
+@lru_cache(maxsize=32)
+def _discover_profiles_cached(prefix: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Memoized profile scan; mtime_ns of the directory is part of the key."""
+    # scandir reports file types from the directory read itself, so this
+    # is a single pass with no per-entry stat or Path construction
+    with os.scandir(get_profiles_dir()) as entries:
+        profiles = sorted([
+            entry.name for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".json")
+            and entry.is_file()
+        ])
+
+    # Ensure default is first if it exists and matches prefix
+    default_name = f"{prefix}default.json" if prefix else "default.json"
+    if default_name in profiles:
+        profiles.remove(default_name)
+        profiles.insert(0, default_name)
+
+    return tuple(profiles) if profiles else ("default.json",)
+
+
 def discover_profiles(prefix: str = "") -> List[str]:
     """
     Discover all available JSON profiles, optionally filtered by prefix.
 
+    Results are cached until the profiles directory changes, and repeat
+    calls within _DISCOVER_TTL seconds skip the directory stat as well.
+
     Args:
         prefix: Optional prefix to filter profiles (e.g., "subject_")
 
     Returns:
         List of profile filenames (without path)
     """
-    profiles_dir = get_profiles_dir()
+    now = time.monotonic()
+    recent = _DISCOVER_RECENT.get(prefix)
+    if recent is not None and now - recent[0] < _DISCOVER_TTL:
+        return list(recent[1])
 
-    if not profiles_dir.exists():
+    try:
+        mtime_ns = get_profiles_dir().stat().st_mtime_ns
+    except FileNotFoundError:
         return ["default.json"]
 
-    pattern = f"{prefix}*.json" if prefix else "*.json"
-    profiles = sorted([
-        f.name for f in profiles_dir.glob(pattern)
-        if f.is_file()
-    ])
-
-    # Ensure default is first if it exists and matches prefix
-    default_name = f"{prefix}default.json" if prefix else "default.json"
-    if default_name in profiles:
-        profiles.remove(default_name)
-        profiles.insert(0, default_name)
-
-    return profiles if profiles else ["default.json"]
+    profiles = _discover_profiles_cached(prefix, mtime_ns)
+    _DISCOVER_RECENT[prefix] = (now, profiles)
+    return list(profiles)
 
 
 def load_profile(profile_name: str) -> Dict:
@@ -93,16 +144,27 @@ def load_profile(profile_name: str) -> Dict:
 
     Raises:
         FileNotFoundError: If profile doesn't exist
-        ValueError: If profile is missing required fields
+        ValueError: If profile is missing required fields or a template
+            references a pool that does not exist
     """
     profiles_dir = get_profiles_dir()
     profile_path = profiles_dir / profile_name
 
-    if not profile_path.exists():
-        raise FileNotFoundError(f"Profile not found: {profile_name}")
-
-    with open(profile_path, 'r', encoding='utf-8') as f:
-        profile = json.load(f)
+    try:
+        stat = profile_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Profile not found: {profile_name}") from None
+
+    if orjson is not None and stat.st_size >= _MMAP_MIN_BYTES:
+        with open(profile_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            profile = orjson.loads(view)
+    elif orjson is not None:
+        profile = orjson.loads(profile_path.read_bytes())
+    else:
+        with open(profile_path, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
 
     # Validate required fields
     if 'templates' not in profile:
@@ -110,9 +172,30 @@ def load_profile(profile_name: str) -> Dict:
     if 'pools' not in profile:
         raise ValueError(f"Profile {profile_name} missing 'pools' field")
 
+    _compile_profile(profile)
+
     return profile
 
 
+@lru_cache(maxsize=64)
+def _load_profile_cached(profile_name: str, mtime_ns: int) -> Dict:
+    """Memoized load_profile; mtime_ns is part of the key so edits invalidate."""
+    return load_profile(profile_name)
+
+
+def load_profile_cached(profile_name: str) -> Dict:
+    """
+    Load a profile, reusing the parsed result until the file changes on disk.
+
+    The returned dictionary is shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = (get_profiles_dir() / profile_name).stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Profile not found: {profile_name}") from None
+    return _load_profile_cached(profile_name, mtime_ns)
+
+
 def calculate_combinations(profile: Dict) -> int:
     """Calculate total unique combinations for a profile."""
     total = len(profile.get('templates', []))
@@ -121,6 +204,122 @@ def calculate_combinations(profile: Dict) -> int:
     return total
 
 
+# ============================================================================
+# PROFILE COMPILATION
+# ============================================================================
+
+def _compile_template(template: str, slots: Dict[str, int]) -> Optional[List[Tuple[str, Optional[int]]]]:
+    """
+    Parse a template once into (literal, pool_slot) segments.
+
+    pool_slot is the pool's position in _pool_keys; the final segment carries
+    the trailing literal with pool_slot None. Returns None if the template
+    uses format specs, conversions or index/attribute access (e.g.
+    {color[0]}), which are left to str.format.
+
+    Raises:
+        ValueError: If a placeholder does not name a pool
+    """
+    segments = []
+    pending = ""
+    compiled = True
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        pending += literal
+        if field is None:
+            continue
+        name = _string.formatter_field_name_split(field)[0]
+        refs = [name]
+        if spec:
+            # Specs may nest placeholders of their own, e.g. {n:{width}}
+            for _, inner, _, _ in _FORMATTER.parse(spec):
+                if inner is not None:
+                    refs.append(_string.formatter_field_name_split(inner)[0])
+        for ref in refs:
+            if ref not in slots:
+                raise ValueError(f"Template {template!r} references unknown pool '{ref}'")
+        if spec or conversion or name != field:
+            compiled = False
+            continue
+        segments.append((sys.intern(pending), slots[name]))
+        pending = ""
+    segments.append((sys.intern(pending), None))
+    return segments if compiled else None
+
+
+def _compile_profile(profile: Dict) -> Dict:
+    """Precompute generation tables for a profile (stored under '_' keys)."""
+    pools = profile['pools']
+    profile['_pool_keys'] = tuple(pools.keys())
+    # str() for the segment join, interned so vocabulary shared across
+    # pools/profiles is stored once; format_map templates use the raw pools
+    profile['_pool_values'] = tuple(
+        tuple(sys.intern(str(entry)) for entry in pool) for pool in pools.values()
+    )
+    profile['_pool_lens'] = tuple(len(v) for v in profile['_pool_values'])
+    slots = {key: i for i, key in enumerate(profile['_pool_keys'])}
+    profile['_compiled_templates'] = [
+        _compile_template(t, slots) for t in profile['templates']
+    ]
+    profile['_combinations'] = calculate_combinations(profile)
+    profile['_generator'] = _build_generator(profile)
+    return profile
+
+
+def _build_generator(profile: Dict) -> Callable[[int, int], str]:
+    """
+    Build a prompt function specialized to one compiled profile.
+
+    Each template is turned into a single expression that concatenates its
+    literals with inline pool lookups, pool sizes and coordinates baked in
+    as constants. Only generated names and integers appear in the source;
+    all profile text is bound through the exec namespace.
+    """
+    pool_keys = profile['_pool_keys']
+    pool_lens = profile['_pool_lens']
+    namespace = {'digest': xxhash.xxh32_intdigest, 'pack': _PACK_COORD2}
+    for slot, pool in enumerate(profile['_pool_values']):
+        namespace[f"P{slot}"] = pool
+        namespace[f"K{slot}"] = pool_keys[slot]
+        # Original entries, so format specs like {n:03d} see numbers
+        namespace[f"R{slot}"] = tuple(profile['pools'][pool_keys[slot]])
+
+    def pick(slot: int, table: str = "P") -> str:
+        return f"{table}{slot}[digest(pack(prompt_idx, {slot + 1}), seed) % {pool_lens[slot]}]"
+
+    source = []
+    for t, segments in enumerate(profile['_compiled_templates']):
+        if segments is None:
+            # Format specs, conversions, index/attribute access: str.format
+            namespace[f"T{t}"] = profile['templates'][t]
+            items = ", ".join(f"K{slot}: {pick(slot, 'R')}" for slot in range(len(pool_keys)))
+            expr = f"T{t}.format_map({{{items}}})"
+        else:
+            terms = []
+            for j, (literal, slot) in enumerate(segments):
+                if literal:
+                    namespace[f"L{t}_{j}"] = literal
+                    terms.append(f"L{t}_{j}")
+                if slot is not None:
+                    terms.append(pick(slot))
+            if len(terms) > 1:
+                # A tuple display does not nest, unlike a long a + b + ...
+                # chain, so compile() has no depth limit on template length
+                expr = f'"".join(({", ".join(terms)}))'
+            else:
+                expr = terms[0] if terms else '""'
+        source.append(f"def _template_{t}(seed, prompt_idx):\n    return {expr}\n")
+
+    template_count = len(profile['_compiled_templates'])
+    source.append(
+        "def _generate(seed, prompt_idx):\n"
+        "    seed &= 0xFFFFFFFF\n"
+        f"    return TEMPLATES[digest(pack(prompt_idx, 0), seed) % {template_count}](seed, prompt_idx)\n"
+    )
+    exec(compile("\n".join(source), "<zero2json profile>", "exec"), namespace)
+    namespace['TEMPLATES'] = tuple(namespace[f"_template_{t}"] for t in range(template_count))
+    return namespace['_generate']
+
+
 # ============================================================================
 # PROMPT GENERATION
 # ============================================================================
@@ -131,7 +330,7 @@ def generate_prompt(seed: int, prompt_idx: int, profile: Dict) -> str:
 
     Algorithm:
     1. Select template using coordinate 0
-    2. For each pool (i), select component using coordinate i+1
+    2. For each pool (i) the template uses, select component using coordinate i+1
     3. Format template with selected components
 
     Args:
@@ -142,27 +341,31 @@ def generate_prompt(seed: int, prompt_idx: int, profile: Dict) -> str:
     Returns:
         Generated prompt string
     """
-    templates = profile['templates']
-    pools = profile['pools']
+    generator = profile.get('_generator')
+    if generator is None:
+        generator = _compile_profile(profile)['_generator']
+    return generator(seed, prompt_idx)
 
-    # Step 1: Select template
-    template_hash = prompt_hash(seed, prompt_idx, 0)
-    template = templates[hash_to_index(template_hash, len(templates))]
 
-    # Step 2: Generate each component
-    components = {}
-    for i, (key, pool) in enumerate(pools.items()):
-        component_hash = prompt_hash(seed, prompt_idx, i + 1)
-        components[key] = pool[hash_to_index(component_hash, len(pool))]
+def generate_prompts_batch(seed: int, prompt_indices: Iterable[int], profile: Dict) -> List[str]:
+    """
+    Generate prompts for many indices of the same seed and profile.
 
-    # Step 3: Format template with components
-    try:
-        return template.format(**components)
-    except KeyError:
-        # Graceful fallback if template references non-existent pool
-        for key in pools.keys():
-            template = template.replace(f"{{{key}}}", components.get(key, f"[{key}]"))
-        return template
+    Equivalent to [generate_prompt(seed, i, profile) for i in prompt_indices],
+    but resolves the profile's generator once for the whole batch.
+
+    Args:
+        seed: World seed for global randomization
+        prompt_indices: Positions in infinite prompt space
+        profile: Loaded profile dictionary with templates and pools
+
+    Returns:
+        List of generated prompt strings, in input order
+    """
+    generator = profile.get('_generator')
+    if generator is None:
+        generator = _compile_profile(profile)['_generator']
+    return [generator(seed, prompt_idx) for prompt_idx in prompt_indices]
 
 
 # ============================================================================
@@ -175,8 +378,8 @@ class Zero2JSONBaseNode:
     Provides common functionality for profile-based zeroprompt generation.
     """
 
-    # Class-level profile cache
-    _profile_cache: Dict[str, Dict] = {}
+    # Nodes are stateless; skip the per-instance __dict__
+    __slots__ = ()
 
     # Node metadata (override in subclasses)
     PROFILE_PREFIX = ""  # e.g., "subject_", "camera_"
@@ -253,14 +456,11 @@ class Zero2JSONBaseNode:
         if profile is None:
             profile = self.DEFAULT_PROFILE
 
-        # Load profile (with caching)
-        if profile not in self._profile_cache:
-            try:
-                self._profile_cache[profile] = load_profile(profile)
-            except (FileNotFoundError, ValueError, json.JSONDecodeError) as e:
-                return (f"[Error loading profile '{profile}': {str(e)}]",)
-
-        profile_data = self._profile_cache[profile]
+        # Load profile (cached until the file changes)
+        try:
+            profile_data = load_profile_cached(profile)
+        except (FileNotFoundError, ValueError, json.JSONDecodeError) as e:
+            return (f"[Error loading profile '{profile}': {str(e)}]",)
 
         # Generate prompt
         prompt = generate_prompt(seed, prompt_index, profile_data)
@@ -276,5 +476,4 @@ class Zero2JSONBaseNode:
                    prefix: str = "", suffix: str = "", **kwargs):
         """Ensure node updates when inputs change."""
         profile_str = profile or cls.DEFAULT_PROFILE
-        profile_hash = xxhash.xxh32(profile_str.encode()).intdigest()
-        return prompt_hash(seed ^ profile_hash, prompt_index, 0)
+        return prompt_hash(seed ^ profile_name_hash(profile_str), prompt_index, 0)
@@ -17,6 +17,8 @@ class Z2J_CameraAngle(Zero2JSONBaseNode):
     camera positioning, tilt, and perspective.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "camera_angle_"
     DEFAULT_PROFILE = "camera_angle_default.json"
     NODE_DISPLAY_NAME = "Z2J Camera Angle"
@@ -46,6 +48,8 @@ class Z2J_CameraDistance(Zero2JSONBaseNode):
     shot framing and subject-to-camera relationship.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "camera_distance_"
     DEFAULT_PROFILE = "camera_distance_default.json"
     NODE_DISPLAY_NAME = "Z2J Camera Distance"
@@ -66,6 +70,8 @@ class Z2J_CameraDoF(Zero2JSONBaseNode):
     describing focus planes, bokeh, and sharpness distribution.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "camera_dof_"
     DEFAULT_PROFILE = "camera_dof_default.json"
     NODE_DISPLAY_NAME = "Z2J Camera DoF"
@@ -95,6 +101,8 @@ class Z2J_CameraFocus(Zero2JSONBaseNode):
     what elements are sharp and where attention is drawn.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "camera_focus_"
     DEFAULT_PROFILE = "camera_focus_default.json"
     NODE_DISPLAY_NAME = "Z2J Camera Focus"
@@ -17,6 +17,8 @@ class Z2J_Composition(Zero2JSONBaseNode):
     leading lines, framing, and compositional techniques.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "composition_"
     DEFAULT_PROFILE = "composition_default.json"
     NODE_DISPLAY_NAME = "Z2J Composition"
@@ -17,6 +17,8 @@ class Z2J_Lighting(Zero2JSONBaseNode):
     color temperature, and overall illumination setup.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "lighting_"
     DEFAULT_PROFILE = "lighting_default.json"
     NODE_DISPLAY_NAME = "Z2J Lighting"
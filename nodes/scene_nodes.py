@@ -17,6 +17,8 @@ class Z2J_Scene(Zero2JSONBaseNode):
     location, atmosphere, and environmental context.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "scene_"
     DEFAULT_PROFILE = "scene_default.json"
     NODE_DISPLAY_NAME = "Z2J Scene"
@@ -50,6 +52,8 @@ class Z2J_Background(Zero2JSONBaseNode):
     and environmental details behind the main subjects.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "background_"
     DEFAULT_PROFILE = "background_default.json"
     NODE_DISPLAY_NAME = "Z2J Background"
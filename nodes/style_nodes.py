@@ -17,6 +17,8 @@ class Z2J_Style(Zero2JSONBaseNode):
     artistic medium, aesthetic approach, and rendering style.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "style_"
     DEFAULT_PROFILE = "style_default.json"
     NODE_DISPLAY_NAME = "Z2J Style"
@@ -46,6 +48,8 @@ class Z2J_Mood(Zero2JSONBaseNode):
     and psychological feeling of the image.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "mood_"
     DEFAULT_PROFILE = "mood_default.json"
     NODE_DISPLAY_NAME = "Z2J Mood"
@@ -17,6 +17,8 @@ class Z2J_SubjectDescription(Zero2JSONBaseNode):
     including physical characteristics, materials, textures, and details.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "subject_description_"
     DEFAULT_PROFILE = "subject_description_default.json"
     NODE_DISPLAY_NAME = "Z2J Subject Description"
@@ -47,6 +49,8 @@ class Z2J_SubjectPosition(Zero2JSONBaseNode):
     horizontal, vertical, and depth positioning.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "subject_position_"
     DEFAULT_PROFILE = "subject_position_default.json"
     NODE_DISPLAY_NAME = "Z2J Subject Position"
@@ -67,6 +71,8 @@ class Z2J_SubjectAction(Zero2JSONBaseNode):
     movement, activity, and dynamic states.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "subject_action_"
     DEFAULT_PROFILE = "subject_action_default.json"
     NODE_DISPLAY_NAME = "Z2J Subject Action"
@@ -96,6 +102,8 @@ class Z2J_SubjectPose(Zero2JSONBaseNode):
     body position, stance, and static configurations.
     """
 
+    __slots__ = ()
+
     PROFILE_PREFIX = "subject_pose_"
     DEFAULT_PROFILE = "subject_pose_default.json"
     NODE_DISPLAY_NAME = "Z2J Subject Pose"
@@ -3,16 +3,24 @@ Zero2JSON Utility Nodes
 Profile information and management utilities
 """
 
+import struct
 from typing import Tuple
 from .base import (
     Zero2JSONBaseNode,
     discover_profiles,
-    load_profile,
-    calculate_combinations,
+    generate_prompts_batch,
+    load_profile_cached,
     get_profiles_dir,
-    prompt_hash
+    profile_name_hash,
 )
-import xxhash
+from xxhash import xxh3_64_intdigest, xxh32_intdigest
+
+# Little-endian uint32 packer for one-shot seed hashing
+_PACK_4U32 = struct.Struct('<IIII').pack
+
+# Batch size limit and the "[i] " labels used by prompts_list
+MAX_BATCH_COUNT = 100
+_INDEX_PREFIXES = tuple(f"[{i}] " for i in range(MAX_BATCH_COUNT))
 
 # ============================================================================
 # PROFILE INFO NODE
@@ -25,6 +33,8 @@ class Z2J_ProfileInfo(Zero2JSONBaseNode):
     Useful for debugging and understanding profile capabilities.
     """
 
+    __slots__ = ()
+
     NODE_DISPLAY_NAME = "Z2J Profile Info"
 
     @classmethod
@@ -47,7 +57,7 @@ class Z2J_ProfileInfo(Zero2JSONBaseNode):
     def get_info(self, profile: str) -> Tuple[str, int]:
         """Get profile information as formatted string."""
         try:
-            profile_data = load_profile(profile)
+            profile_data = load_profile_cached(profile)
         except Exception as e:
             return (f"Error loading profile: {e}", 0)
 
@@ -65,7 +75,7 @@ class Z2J_ProfileInfo(Zero2JSONBaseNode):
         lines.append(f"  templates: {len(profile_data.get('templates', []))} variations")
         lines.append("")
 
-        total = calculate_combinations(profile_data)
+        total = profile_data['_combinations']
         lines.append(f"Total unique prompts: {total:,}")
         lines.append(f"Scientific notation: {total:.2e}")
 
@@ -91,6 +101,8 @@ class Z2J_BatchGenerator(Zero2JSONBaseNode):
     Useful for creating variations or exploring prompt space.
     """
 
+    __slots__ = ()
+
     NODE_DISPLAY_NAME = "Z2J Batch Generator"
 
     @classmethod
@@ -111,7 +123,7 @@ class Z2J_BatchGenerator(Zero2JSONBaseNode):
                 "count": ("INT", {
                     "default": 4,
                     "min": 1,
-                    "max": 100,
+                    "max": MAX_BATCH_COUNT,
                     "tooltip": "Number of prompts to generate"
                 }),
             },
@@ -142,28 +154,32 @@ class Z2J_BatchGenerator(Zero2JSONBaseNode):
         separator: str = "\n---\n"
     ) -> Tuple[str, str]:
         """Generate multiple prompts."""
-        from .base import generate_prompt, load_profile
-
         try:
-            profile_data = load_profile(profile)
+            profile_data = load_profile_cached(profile)
         except Exception as e:
             return (f"Error: {e}", "[]")
 
-        prompts = []
-        for i in range(count):
-            prompt = generate_prompt(seed, start_index + i, profile_data)
-            prompts.append(prompt)
+        prompts = generate_prompts_batch(
+            seed, range(start_index, start_index + count), profile_data
+        )
 
         batch_text = separator.join(prompts)
-        prompts_list = "\n".join([f"[{i}] {p}" for i, p in enumerate(prompts)])
+        prefixes = _INDEX_PREFIXES
+        if count > len(prefixes):
+            prefixes = tuple(f"[{i}] " for i in range(count))
+        prompts_list = "\n".join([prefix + p for prefix, p in zip(prefixes, prompts)])
 
         return (batch_text, prompts_list)
 
     @classmethod
     def IS_CHANGED(cls, seed: int, start_index: int, count: int,
                    profile: str = "default.json", separator: str = "\n---\n"):
-        profile_hash = xxhash.xxh32(profile.encode()).intdigest()
-        return prompt_hash(seed ^ profile_hash, start_index, count)
+        # Masked like the generator, so 64-bit seeds from linked nodes work
+        key = _PACK_4U32(seed & 0xFFFFFFFF, start_index & 0xFFFFFFFF,
+                         count & 0xFFFFFFFF, profile_name_hash(profile))
+        # batch_text embeds the separator; keyed like the profile name so
+        # the result does not depend on PYTHONHASHSEED
+        return (xxh3_64_intdigest(key) ^ profile_name_hash(separator)) & 0xFFFFFFFF
 
 
 # ============================================================================
@@ -177,6 +193,8 @@ class Z2J_SeedMixer(Zero2JSONBaseNode):
     Useful for creating compound seeds from multiple sources.
     """
 
+    __slots__ = ()
+
     NODE_DISPLAY_NAME = "Z2J Seed Mixer"
 
     @classmethod
@@ -222,19 +240,11 @@ class Z2J_SeedMixer(Zero2JSONBaseNode):
         seed_4: int = 0
     ) -> Tuple[int]:
         """Mix seeds using xxhash."""
-        h = xxhash.xxh32()
-        h.update(seed_1.to_bytes(4, 'little'))
-        h.update(seed_2.to_bytes(4, 'little'))
-        h.update(seed_3.to_bytes(4, 'little'))
-        h.update(seed_4.to_bytes(4, 'little'))
-        return (h.intdigest(),)
+        return (xxh32_intdigest(_PACK_4U32(seed_1, seed_2, seed_3, seed_4)),)
 
     @classmethod
     def IS_CHANGED(cls, seed_1: int, seed_2: int = 0, seed_3: int = 0, seed_4: int = 0):
-        h = xxhash.xxh32()
-        h.update(seed_1.to_bytes(4, 'little'))
-        h.update(seed_2.to_bytes(4, 'little'))
-        return h.intdigest()
+        return xxh3_64_intdigest(_PACK_4U32(seed_1, seed_2, seed_3, seed_4)) & 0xFFFFFFFF
 
 
 # ============================================================================